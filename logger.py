@@ -37,12 +37,17 @@ Options:
   -b DATE, --before=DATE     End date of list range
   -y DAYS, --yesterday=DAYS  Use date stamp from DAYS ago
   -t, --today                Add today's date stamp to title
+  --limit=NUM                List at most NUM matching records
+  --offset=NUM               Skip the NUM most recent matching records
+  -r, --reverse              List newest records first
   --plain                    Use plain formatting
 """
 
-from docopt import docopt
-from datetime import datetime, timedelta
+from docopt import docopt, DocoptExit
+from datetime import date as Date, datetime, timedelta
 from os.path import expanduser
+from itertools import islice
+from functools import lru_cache
 import subprocess
 import re
 import yaml
@@ -262,8 +267,8 @@ class Logger(object):
     def __init__(self, ifname=None, recs=None, printer=None):
         "Load log data from a file or an existing data structure."
         self.printer = printer or RecPrinter()
-        if recs:
-            self.recs = self.recs
+        if recs is not None:
+            self.recs = recs
         else:
             try:
                 with open(ifname, 'rt') as f:
@@ -320,30 +325,48 @@ class Logger(object):
         if note is not None:
             self.last['note'] = note
 
-    def filtered_recs(self, filters=[]):
-        "Return a filtered list of records."
-        recs = self.recs
+    def filtered_recs(self, filters=[], reverse=False):
+        "Return a filtered iterator over records (newest first if reverse)."
+        recs = reversed(self.recs) if reverse else iter(self.recs)
         for f in filters:
             recs = filter(f, recs)
         return recs
 
-    def list(self, filters=[], verbose=True):
-        "Print a filtered list of records."
-        count = 0
-        for rec in self.filtered_recs(filters):
+    def paged_recs(self, filters=[], limit=None, offset=0, reverse=False):
+        """Generate a page of filtered records.
+
+        The offset and limit count matches back from the most recent
+        record, so the scan runs from the end of the log and stops as
+        soon as the page is full.  Records are generated newest first
+        if reverse is set, and oldest first otherwise.
+        """
+        if limit is None and not offset and not reverse:
+            yield from self.filtered_recs(filters)
+            return
+        stop = None if limit is None else offset+limit
+        page = islice(self.filtered_recs(filters, True), offset, stop)
+        if reverse:
+            yield from page
+        else:
+            yield from reversed(list(page))
+
+    def list(self, filters=[], verbose=True,
+             limit=None, offset=0, reverse=False):
+        "Print a filtered (and optionally paged) list of records."
+        recs = self.paged_recs(filters, limit, offset, reverse)
+        for count, rec in enumerate(recs):
             r = rec.copy()
             r['count'] = count
-            count += 1
             self.printer.print(r, verbose=verbose)
 
-    def calendar(self, filters=[], verbose=True):
-        "Print a filtered list of records in calendar form."
-        count = 0
+    def calendar(self, filters=[], verbose=True,
+                 limit=None, offset=0, reverse=False):
+        "Print a filtered (and optionally paged) list in calendar form."
         pdate = None
-        for rec in self.filtered_recs(filters):
+        recs = self.paged_recs(filters, limit, offset, reverse)
+        for count, rec in enumerate(recs):
             r = rec.copy()
             r['count'] = count
-            count += 1
             if not pdate or pdate != rec['date']:
                 print(" ")
                 print(rec['date'].strftime('%Y-%m-%d %a'))
@@ -450,40 +473,111 @@ class TodoLogger(Logger):
 # Parsing date strings and title strings
 
 
+date_re = re.compile(r'(\d\d\d\d)-(\d\d)-(\d\d)\Z', re.ASCII)
+int_re = re.compile(r'-?(0|[1-9][0-9]*)\Z')
+word_re = re.compile(r'[A-Za-z][A-Za-z0-9_-]*\Z')
+field_re = re.compile(r'([a-z][a-z0-9_]*):(\S+)\Z')
+yaml_words = {'yes', 'no', 'true', 'false', 'on', 'off', 'null'}
+bookkeeping_fields = {'date', 'desc', 'tags', 'note', 'tstamp', 'tfinish'}
+
+
 def parse_date(s):
     "Convert a text date string into a datetime.date"
+    m = date_re.match(s)
+    if m:
+        return Date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
     dtime = datetime.strptime(s, "%Y-%m-%d")
     return dtime.date()
 
 
+@lru_cache(maxsize=1024)
+def load_scalar(s):
+    "Parse a YAML scalar (memoised, since field values repeat a lot)."
+    return yaml.safe_load(s)
+
+
+def parse_value(s):
+    "Convert a field value string, avoiding YAML for the common cases."
+    if int_re.match(s):
+        return int(s)
+    if date_re.match(s):
+        return parse_date(s)
+    if word_re.match(s) and s.lower() not in yaml_words:
+        return s
+    value = load_scalar(s)
+    if isinstance(value, (list, dict)):
+        value = copy.deepcopy(value)
+    return value
+
+
+def format_value(v):
+    "Render a field value as a single token that parse_value reads back."
+    if isinstance(v, int) and not isinstance(v, bool):
+        return str(v)
+    if isinstance(v, Date) and not isinstance(v, datetime):
+        return v.isoformat()
+    if isinstance(v, str) and word_re.match(v) and \
+       v.lower() not in yaml_words:
+        return v
+    s = yaml.dump(v, default_flow_style=True, width=float('inf'))
+    if s.endswith('\n...\n'):
+        s = s[:-4]
+    s = s.rstrip('\n')
+    if re.search(r'\s', s):
+        raise ValueError('Field value {0!r} is not a single token'.format(v))
+    return s
+
+
 def split_desc(desc=None):
     "Split a title string into date, description, fields, and tags."
     if desc is None:
         return (None, None, None, None)
-    m = re.match('(\d\d\d\d-\d\d-\d\d)(\s*)', desc)
-    if m:
-        date = parse_date(desc[m.start(1):m.end(1)])
-        desc = desc[m.end(2):]
-    else:
-        date = None
+    date = None
+    if date_re.match(desc[:10]):
+        date = parse_date(desc[:10])
+        desc = desc[10:].lstrip()
     l = desc.split(" +")
     if len(l[0]) == 0:
-        desc = None
-        tags = None
+        return (None, l[1:] or None, date, {})
     elif l[0][0] == "+":
         l[0] = l[0][1:]
-        desc = None
-        tags = l
-    elif len(l) == 1:
-        desc = l[0]
-        tags = None
-    else:
-        desc = l[0]
-        tags = l[1:]
-    fields = {m.group(1): yaml.load(m.group(2))
-              for m in re.finditer('([a-z][a-z0-9_]*):([^\s]+)', desc)}
-    desc = re.sub('([a-z][a-z0-9_]*):([^\s]+)', '', desc).strip()
-    return (desc, tags, date, fields)
+        return (None, l, date, {})
+    tags = l[1:] or None
+    words = re.split(r'(\s+)', l[0])
+    fields = {}
+    for i in range(0, len(words), 2):
+        m = field_re.match(words[i])
+        if m:
+            fields[m.group(1)] = parse_value(m.group(2))
+            words[i] = ''
+    return ("".join(words).strip(), tags, date, fields)
+
+
+def join_desc(desc=None, tags=None, date=None, fields=None):
+    "Join description, tags, date, and fields into a title string."
+    parts = []
+    if date is not None:
+        parts.append(date.isoformat())
+    if desc:
+        if desc.startswith("+") or " +" in desc or \
+           (date is None and date_re.match(desc[:10])) or \
+           any(field_re.match(word) for word in desc.split()):
+            raise ValueError('Description {0!r} would not parse '
+                             'back as plain text'.format(desc))
+        parts.append(desc)
+    for key, value in (fields or {}).items():
+        if not field_re.fullmatch('{0}:x'.format(key)):
+            raise ValueError('Field name {0!r} is not valid'.format(key))
+        parts.append("{0}:{1}".format(key, format_value(value)))
+    parts.extend("+{0}".format(tag) for tag in tags or [])
+    return " ".join(parts)
+
+
+def rec_desc(rec):
+    "Render a record in compact title form (inverse of split_desc)."
+    fields = {k: v for k, v in rec.items() if k not in bookkeeping_fields}
+    return join_desc(rec.get('desc'), rec.get('tags'), rec.get('date'),
+                     fields)
 
 
 # ==================================================================
@@ -562,6 +656,22 @@ def main():
                date_filter(date, date),
                date_filter(after, before)]
 
+    # Set up paging for list commands
+    def get_count(name, default=None):
+        if options[name] is None:
+            return default
+        try:
+            count = int(options[name])
+        except ValueError:
+            count = -1
+        if count < 0:
+            raise DocoptExit('{0} must be a non-negative integer'.format(name))
+        return count
+
+    page = {'limit': get_count('--limit'),
+            'offset': get_count('--offset', 0),
+            'reverse': options['--reverse']}
+
     # Set clock / tfinish from command line
     def set_clock(done=False):
         if options['--prev']:
@@ -613,9 +723,9 @@ def main():
         id = int(options['ID'])
         logger.update(desc, date, fields, tags, id)
     elif options['list'] or options['ls']:
-        logger.list(filters=filters, verbose=options['list'])
+        logger.list(filters=filters, verbose=options['list'], **page)
     elif options['cal']:
-        logger.calendar(filters=filters, verbose=False)
+        logger.calendar(filters=filters, verbose=False, **page)
     elif options['clock']:
         logger.list(filters=filters, verbose=False)
         t = logger.clock(filters=filters)
@@ -0,0 +1,119 @@
+from datetime import date, datetime
+
+import pytest
+import yaml
+
+from logger import (Logger, RecPrinter, plain_formats, tags_filter,
+                    parse_value, format_value, split_desc, join_desc,
+                    rec_desc)
+
+
+def outcome(f, s):
+    "Return (type, value) of f(s), or the exception type if it raises."
+    try:
+        v = f(s)
+    except ValueError:
+        return ValueError
+    return (type(v), v)
+
+
+@pytest.mark.parametrize('s', [
+    '0', '7', '-4', '-0', '0755', '1_000', '+5', '1.5', '1e3', '10:30',
+    '2016-07-04', '2016-7-4', '2016-13-45', 'hello', 'a-b_c', 'yes', 'No',
+    'On', 'OFF', 'true', 'null', 'NULL', '~', 'y', 'http://x.com',
+    "'a'", '[a,b]', '{a:1}'
+])
+def test_parse_value_matches_yaml(s):
+    assert outcome(parse_value, s) == outcome(yaml.safe_load, s)
+
+
+@pytest.mark.parametrize('title, parsed', [
+    ('2016-07-04', (None, None, date(2016, 7, 4), {})),
+    ('2016-07-04 +a +b', (None, ['a', 'b'], date(2016, 7, 4), {})),
+    ('+a +b', (None, ['a', 'b'], None, {})),
+    (' +work', (None, ['work'], None, {})),
+    ('', (None, None, None, {})),
+    ('foo  bar n:3 +a', ('foo  bar', ['a'], None, {'n': 3})),
+    ('Xfoo:bar', ('Xfoo:bar', None, None, {})),
+])
+def test_split_desc(title, parsed):
+    assert split_desc(title) == parsed
+
+
+@pytest.mark.parametrize('title', [
+    '2016-07-04 Did thing due:2016-08-01 n:3 x:true r:1.5 s:hello +a +b',
+    '2016-07-04 +a',
+    'Read a:0755 u:http://x.com +b c',
+])
+def test_join_desc_round_trip(title):
+    parsed = split_desc(title)
+    assert split_desc(join_desc(*parsed)) == parsed
+
+
+def test_rec_desc_round_trip():
+    rec = {'date': date(2016, 7, 4), 'desc': 'hi there', 'tags': ['a'],
+           'due': date(2016, 8, 1), 'tclock': 5, 'note': 'skipped',
+           'tstamp': datetime(2016, 7, 4, 10, 0)}
+    desc, tags, d, fields = split_desc(rec_desc(rec))
+    assert (desc, tags, d) == ('hi there', ['a'], date(2016, 7, 4))
+    assert fields == {'due': date(2016, 8, 1), 'tclock': 5}
+
+
+@pytest.mark.parametrize('value', [
+    'a b', datetime(2016, 7, 4, 10, 0), ['a', 'b'], {'a': 1}
+])
+def test_format_value_rejects_multiple_tokens(value):
+    with pytest.raises(ValueError):
+        format_value(value)
+
+
+@pytest.mark.parametrize('desc', ['a foo:bar', '+a', 'a +b',
+                                  '2016-08-01 meeting'])
+def test_join_desc_rejects_ambiguous_desc(desc):
+    with pytest.raises(ValueError):
+        join_desc(desc)
+
+
+@pytest.mark.parametrize('key', ['S', 'dueDate', 'due-date', '1st'])
+def test_join_desc_rejects_bad_field_names(key):
+    with pytest.raises(ValueError):
+        join_desc('foo', fields={key: 1})
+
+
+def make_logger():
+    "Build a logger with six records over three days, odd ones tagged a."
+    recs = [{'date': date(2016, 7, 1 + i // 2), 'desc': 'r{0}'.format(i),
+             'tags': ['a' if i % 2 else 'b']} for i in range(6)]
+    return Logger(recs=recs, printer=RecPrinter(plain_formats))
+
+
+@pytest.mark.parametrize('filters, page, descs', [
+    ([], {}, ['r0', 'r1', 'r2', 'r3', 'r4', 'r5']),
+    ([], {'limit': 2}, ['r4', 'r5']),
+    ([], {'limit': 2, 'offset': 1}, ['r3', 'r4']),
+    ([], {'limit': 2, 'offset': 1, 'reverse': True}, ['r4', 'r3']),
+    ([], {'offset': 4}, ['r0', 'r1']),
+    ([], {'reverse': True}, ['r5', 'r4', 'r3', 'r2', 'r1', 'r0']),
+    ([], {'limit': 0}, []),
+    ([tags_filter(['a'])], {'limit': 2}, ['r3', 'r5']),
+    ([tags_filter(['a'])], {'limit': 2, 'offset': 1, 'reverse': True},
+     ['r3', 'r1']),
+])
+def test_paged_recs(filters, page, descs):
+    recs = make_logger().paged_recs(filters, **page)
+    assert [rec['desc'] for rec in recs] == descs
+
+
+def test_list_paged(capsys):
+    make_logger().list(verbose=False, limit=2, reverse=True)
+    assert capsys.readouterr().out.splitlines() == \
+        ['2016-07-03 r5 +a', '2016-07-03 r4 +b']
+
+
+def test_calendar_reverse_headers(capsys):
+    make_logger().calendar(verbose=False, limit=3, reverse=True)
+    lines = capsys.readouterr().out.splitlines()
+    assert [l for l in lines if l.startswith('2016')] == \
+        ['2016-07-03 Sun', '2016-07-02 Sat']
+    assert [l.strip() for l in lines if l.startswith('  ')] == \
+        ['r5 +a', 'r4 +b', 'r3 +a']